@@ -8,16 +8,31 @@ PNG directory or video file) and encoded via FFmpeg.
 """
 
 import argparse
+import collections
 import math
 import os
+import queue
 import random
 import struct
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    import numba
+except ImportError:  # optional: fused compositing kernel
+    numba = None
+
+try:
+    import cupy
+except ImportError:  # optional: GPU compositing with --gpu
+    cupy = None
+
 
 # ---------------------------------------------------------------------------
 # Overlay Renderer
@@ -52,6 +67,7 @@ class OverlayRenderer:
             px_per_mm = diag_px / diag_mm
             self._sensor_grid_w = int(sensor_pcb_size[0] * px_per_mm)
             self._sensor_grid_h = int(sensor_pcb_size[1] * px_per_mm)
+        self._init_counter()
 
         # bars
         self.enable_bars = enable_bars
@@ -61,6 +77,8 @@ class OverlayRenderer:
         # sync dots
         self.enable_sync_dots = enable_sync_dots
         self.sync_dot_count = sync_dot_count
+        if enable_sync_dots:
+            self._init_sync_dots()
 
         # grid
         self.enable_grid = enable_grid
@@ -79,6 +97,9 @@ class OverlayRenderer:
                 print(f"Warning: ticker image '{ticker_image}' not found, "
                       "disabling ticker.")
                 self.enable_ticker = False
+        self._ticker_strip = None
+        if self.ticker_image_obj is not None:
+            self._init_ticker()
 
         # snow
         self.enable_snow = enable_snow
@@ -108,6 +129,18 @@ class OverlayRenderer:
             # zero-pad width based on total frames
             self._fn_pad = len(str(total_frames))
 
+        # static layers (alignment grid) never change between frames, so
+        # draw them once and start every frame from a copy
+        self._static_layer = np.zeros((height, width, 4), dtype=np.uint8)
+        if self.enable_grid:
+            self._draw_alignment_grid(self._static_layer)
+
+        # per-thread reusable overlay buffer, image view and draw context
+        self._scratch = threading.local()
+
+        # enable flags are fixed from here on
+        self._init_steps()
+
     # -- font loading --
 
     @staticmethod
@@ -165,6 +198,29 @@ class OverlayRenderer:
         draw.text((0, y_offset), full_text, fill=(255, 255, 255), font=font)
         return img
 
+    # -- ticker strip --
+
+    def _init_ticker(self, ticker_h=64):
+        """Pre-scale and tile the ticker image into a wide scrolling strip."""
+        tex_w, tex_h = self.ticker_image_obj.size
+
+        # scale ticker height to match ticker_h while preserving aspect
+        scale = ticker_h / tex_h
+        scaled_w = int(tex_w * scale)
+        ticker_scaled = self.ticker_image_obj.resize(
+            (scaled_w, ticker_h), Image.BILINEAR
+        ).convert("RGBA")
+
+        # tile enough copies that a screen-wide window starting anywhere in
+        # the first copy stays inside the strip
+        copies = -(-self.width // scaled_w) + 1
+        strip = Image.new("RGBA", (scaled_w * copies, ticker_h))
+        for i in range(copies):
+            strip.paste(ticker_scaled, (i * scaled_w, 0))
+
+        self._ticker_strip = strip
+        self._ticker_scaled_w = scaled_w
+
     # -- snow buffer --
 
     def _init_snow(self):
@@ -186,60 +242,105 @@ class OverlayRenderer:
         cols = sw // k
         rows = (sh // k) * buf_pages
 
-        # generate random blocks
-        pixels = []
-        for _ in range(rows):
-            row_data = []
-            for _ in range(cols):
-                r, g, b = random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)
-                row_data.extend([r, g, b] * k)
-            row_bytes = bytes(row_data)
-            for _ in range(k):
-                pixels.append(row_bytes)
+        # generate random blocks, then expand each block to k x k pixels;
+        # stored as opaque RGBA so frames can use it without conversion
+        rng = np.random.default_rng()
+        blocks = rng.integers(0, 256, (rows, cols, 3), dtype=np.uint8)
+        pixels = np.empty((rows * k, cols * k, 4), dtype=np.uint8)
+        pixels[..., :3] = np.repeat(np.repeat(blocks, k, axis=0), k, axis=1)
+        pixels[..., 3] = 255
 
         self._snow_buffer = pixels
-        self._snow_total_rows = len(pixels)
+        self._snow_total_rows = pixels.shape[0]
 
     # -- rendering entry point --
 
-    def render_frame(self, frame_number):
-        """Render the complete overlay for one frame. Returns an RGBA Image."""
-        img = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
+    def _init_steps(self):
+        """Resolve the enabled overlay elements into an ordered draw list.
 
+        Each step is (drawer, canvas), where canvas names the per-thread
+        target the drawer works on: the "overlay" array, its Pillow "img"
+        view, or the "draw" context on that view.
+        """
         # In the original OpenGL code, depth testing (GL_LESS) prevented later
         # draws from overwriting earlier ones at the same Z. In Pillow 2D, the
         # last draw wins. So we reverse the priority: draw background elements
         # first, then foreground elements (counter) last to keep them visible.
-        if self.enable_grid:
-            self._draw_alignment_grid(draw)
-        if self.enable_snow:
-            self._draw_snow(img, frame_number)
+        # The alignment grid is part of the static layer every frame starts
+        # from.
+        steps = []
+        if self.enable_snow and self._snow_buffer is not None:
+            steps.append((self._draw_snow, "overlay"))
         if self.enable_bars:
-            self._draw_scrolling_bars(draw, frame_number)
-        if self.enable_ticker:
-            self._draw_ticker(img, frame_number)
+            steps.append((self._draw_scrolling_bars, "overlay"))
+        if self.enable_ticker and self._ticker_strip is not None:
+            steps.append((self._draw_ticker, "img"))
         if self.enable_sync_dots:
-            self._draw_sync_dots(draw, frame_number)
+            steps.append((self._draw_sync_dots, "overlay"))
         # binary counter drawn LAST so it's always visible on top
-        self._draw_binary_counter(draw, frame_number)
+        steps.append((self._draw_binary_counter, "overlay"))
         if self.enable_frame_number:
-            self._draw_frame_number(draw, frame_number)
-        if self.sync_click and frame_number % self.sync_click == 0:
-            self._draw_sync_flash(draw)
+            steps.append((self._draw_frame_number, "draw"))
+        if self.sync_click:
+            steps.append((self._draw_sync_flash, "draw"))
+        self._steps = steps
 
+    @staticmethod
+    def _image_view(overlay):
+        """Wrap an (h, w, 4) uint8 array as an RGBA Image sharing its memory."""
+        h, w = overlay.shape[:2]
+        img = Image.frombuffer("RGBA", (w, h), overlay, "raw", "RGBA", 0, 1)
+        # buffer-backed images are flagged read-only and Pillow would copy
+        # them on the first draw; clear the flag so draws land in the array
+        img.readonly = 0
         return img
 
+    def render_frame(self, frame_number):
+        """Render the complete overlay for one frame.
+
+        Returns an (height, width, 4) uint8 RGBA array. The array is a
+        per-thread buffer that is overwritten by the next call from the
+        same thread.
+        """
+        # the overlay is a NumPy array with a Pillow image sharing its
+        # memory, so elements can be drawn either as array writes or with
+        # ImageDraw; both are created once per thread and reused
+        scratch = self._scratch
+        if not hasattr(scratch, "overlay"):
+            scratch.overlay = np.empty_like(self._static_layer)
+            scratch.img = self._image_view(scratch.overlay)
+            scratch.draw = ImageDraw.Draw(scratch.img)
+            scratch.canvases = {
+                "overlay": scratch.overlay,
+                "img": scratch.img,
+                "draw": scratch.draw,
+            }
+        canvases = scratch.canvases
+
+        # start from the pre-rendered static layer (alignment grid)
+        np.copyto(scratch.overlay, self._static_layer)
+
+        for drawer, canvas in self._steps:
+            drawer(canvases[canvas], frame_number)
+
+        return scratch.overlay
+
+    @staticmethod
+    def _fill_rect(overlay, x0, y0, x1, y1, color):
+        """Fill a rectangle in the overlay array like ImageDraw.rectangle.
+
+        Both corners are inclusive; the rectangle is clipped to the frame.
+        """
+        overlay[max(y0, 0):max(y1 + 1, 0), max(x0, 0):max(x1 + 1, 0)] = color
+
     # -- binary counter --
 
-    def _draw_binary_counter(self, draw, frame_number):
-        """Draw 32-bit frame counter as 8x4 grid of rectangles.
+    def _init_counter(self):
+        """Pre-compute binary counter layout as a cell-index map.
 
-        Normal mode: green = 1-bit, white = 0-bit, on black background.
-        Sensor mode: white = 1-bit, black = 0-bit (for optical sensors).
-        Default: single counter at bottom-left.
-        With --quad-counters: one counter at the top-left of each quadrant
-        (frame divided into a 2x2 video wall layout).
+        The counter region is stored as an array of palette indices (0 =
+        black background, 1..32 = bit cell), so each frame only needs to
+        build a 33-entry palette and do one indexed lookup.
         """
         bits = 32
         cols = 8
@@ -266,8 +367,14 @@ class OverlayRenderer:
         bg_w = cols * (pad_x + bit_w) + pad_x
         bg_h = n_rows * (pad_y + bit_h) + pad_y
 
-        # pack frame number as 4 bytes big-endian
-        data = struct.pack(">I", frame_number & 0xFFFFFFFF)
+        # rectangles are inclusive of both edges, like ImageDraw.rectangle;
+        # later bits overwrite earlier ones where cells touch
+        cells = np.zeros((bg_h + 1, bg_w + 1), dtype=np.uint8)
+        for i in range(bits):
+            x = pad_x + (i % cols) * (bit_w + pad_x)
+            y = pad_y + (i // cols) * (bit_h + pad_y)
+            cells[y:y + bit_h + 1, x:x + bit_w + 1] = i + 1
+        self._counter_cells = cells
 
         if self.quad_counters:
             # 2x2 video wall: counter at top-left of each quadrant
@@ -285,27 +392,47 @@ class OverlayRenderer:
                 (border, self.height - border_y - bg_h),
             ]
 
+        # destination/source slices for each position, clipped to the frame
+        self._counter_blits = []
         for ox, oy in positions:
-            # black background
-            draw.rectangle([ox, oy, ox + bg_w, oy + bg_h], fill=(0, 0, 0, 255))
+            x0, y0 = max(ox, 0), max(oy, 0)
+            x1 = min(ox + bg_w + 1, self.width)
+            y1 = min(oy + bg_h + 1, self.height)
+            if x0 < x1 and y0 < y1:
+                self._counter_blits.append((
+                    (slice(y0, y1), slice(x0, x1)),
+                    (slice(y0 - oy, y1 - oy), slice(x0 - ox, x1 - ox)),
+                ))
+
+        # palette: index 0 is the black background, then per-bit colors
+        if self.sensor_mode:
+            self._counter_colors = np.array(
+                [(0, 0, 0, 255), (255, 255, 255, 255)], dtype=np.uint8)
+        else:
+            self._counter_colors = np.array(
+                [(255, 255, 255, 255), (0, 255, 0, 255)], dtype=np.uint8)
+        self._counter_palette = np.empty((bits + 1, 4), dtype=np.uint8)
+        self._counter_palette[0] = (0, 0, 0, 255)
 
-            # draw bit rectangles
-            for i in range(bits):
-                byte_idx = i // 8
-                bit_idx = 7 - (i % 8)
-                bit_val = (data[byte_idx] >> bit_idx) & 1
+    def _draw_binary_counter(self, overlay, frame_number):
+        """Draw 32-bit frame counter as 8x4 grid of rectangles.
 
-                if self.sensor_mode:
-                    color = (255, 255, 255, 255) if bit_val else (0, 0, 0, 255)
-                else:
-                    color = (0, 255, 0, 255) if bit_val else (255, 255, 255, 255)
+        Normal mode: green = 1-bit, white = 0-bit, on black background.
+        Sensor mode: white = 1-bit, black = 0-bit (for optical sensors).
+        Default: single counter at bottom-left.
+        With --quad-counters: one counter at the top-left of each quadrant
+        (frame divided into a 2x2 video wall layout).
+        """
+        # frame number as 32 bits, MSB first
+        data = struct.pack(">I", frame_number & 0xFFFFFFFF)
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8))
 
-                col = i % cols
-                row = i // cols
+        palette = self._counter_palette.copy()
+        palette[1:] = self._counter_colors[bits]
+        counter = palette[self._counter_cells]
 
-                x = ox + pad_x + col * (bit_w + pad_x)
-                y = oy + pad_y + row * (bit_h + pad_y)
-                draw.rectangle([x, y, x + bit_w, y + bit_h], fill=color)
+        for dst, src in self._counter_blits:
+            overlay[dst] = counter[src]
 
     # -- frame number text --
 
@@ -326,8 +453,10 @@ class OverlayRenderer:
 
     # -- sync flash --
 
-    def _draw_sync_flash(self, draw):
+    def _draw_sync_flash(self, draw, frame_number):
         """Draw a white flash square on sync click frames."""
+        if frame_number % self.sync_click:
+            return
         size = int(0.04 * self.width)
         border = int(0.02 * self.width)
         border_y = int(0.02 * self.height)
@@ -338,172 +467,162 @@ class OverlayRenderer:
 
     # -- scrolling bars --
 
-    def _draw_scrolling_bars(self, draw, frame_number):
+    def _draw_scrolling_bars(self, overlay, frame_number):
         """Draw gray vertical and horizontal scrolling bars."""
         w, h = self.width, self.height
         sw = self.bar_width
         speed = self.bar_speed
         color = (204, 204, 204, 200)
+        fill = self._fill_rect
 
         xs = (frame_number * speed) % w
         ys = (frame_number * speed) % h
 
         # vertical bar (scrolls horizontally)
         if xs + sw > w:
-            draw.rectangle([xs, 0, w, h], fill=color)
-            draw.rectangle([0, 0, (xs + sw) - w, h], fill=color)
+            fill(overlay, xs, 0, w, h, color)
+            fill(overlay, 0, 0, (xs + sw) - w, h, color)
         else:
-            draw.rectangle([xs, 0, xs + sw, h], fill=color)
+            fill(overlay, xs, 0, xs + sw, h, color)
 
         # horizontal bar (scrolls vertically)
         if ys + sw > h:
-            draw.rectangle([0, ys, w, h], fill=color)
-            draw.rectangle([0, 0, w, (ys + sw) - h], fill=color)
+            fill(overlay, 0, ys, w, h, color)
+            fill(overlay, 0, 0, w, (ys + sw) - h, color)
         else:
-            draw.rectangle([0, ys, w, ys + sw], fill=color)
+            fill(overlay, 0, ys, w, ys + sw, color)
 
     # -- sync dots --
 
-    def _draw_sync_dots(self, draw, frame_number):
-        """Draw scrolling sync dots in 4 quadrants along edges."""
+    def _init_sync_dots(self):
+        """Pre-compute the dot strips scrolling along each quadrant edge.
+
+        Each strip is (axis, origin, length, offsets, cross0, cross1): dots
+        scroll along axis (0 = x, 1 = y) within [origin, origin + length),
+        dot i sits at offsets[i] from the scroll position and spans
+        cross0[i]..cross1[i] on the other axis.
+        """
         half_w = self.width // 2
         half_h = self.height // 2
         dot_size = 10
         dot_spacing = 15
         speed = self.bar_speed
         count = self.sync_dot_count
-        color = (255, 0, 0, 255)
 
+        i = np.arange(-count, count + 1)
+        ds = np.where(i == 0, dot_size * 2, dot_size)
+        off1 = i * 2 * dot_spacing      # set 1: uniform scroll
+        off2 = off1 + i * speed         # set 2: per-dot speed offset
+
+        strips = []
         for quadrant in range(4):
             tx = 0 if quadrant >= 2 else half_w
             ty = 0 if quadrant % 2 == 1 else half_h
 
-            xs = (frame_number * speed) % half_w
-            ys = (frame_number * speed) % half_h
-
-            # set 1: uniform scroll
-            for i in range(-count, count + 1):
-                ds_x = dot_size * 2 if i == 0 else dot_size
-                ds_y = dot_size * 2 if i == 0 else dot_size
-                x = (xs + i * 2 * dot_spacing) % half_w
-                y = (ys + i * 2 * dot_spacing) % half_h
-
-                # top/bottom edges: horizontal dots
-                if ty == 0:
-                    bx1 = tx + x
-                    by1 = ty + half_h - ds_y
-                    if x + dot_size > half_w:
-                        draw.rectangle([tx, by1, tx + (x + dot_size - half_w), ty + half_h], fill=color)
-                        draw.rectangle([bx1, by1, tx + half_w, ty + half_h], fill=color)
-                    else:
-                        draw.rectangle([bx1, by1, bx1 + dot_size, ty + half_h], fill=color)
-
-                # left/right edges: vertical dots
-                if tx == 0:
-                    bx1 = tx + half_w - ds_x
-                    by1 = ty + y
-                    if y + dot_size > half_h:
-                        draw.rectangle([bx1, ty, tx + half_w, ty + (y + dot_size - half_h)], fill=color)
-                        draw.rectangle([bx1, by1, tx + half_w, ty + half_h], fill=color)
-                    else:
-                        draw.rectangle([bx1, by1, tx + half_w, by1 + dot_size], fill=color)
-
-            # set 2: per-dot speed offset
-            for i in range(-count, count + 1):
-                ds_x = dot_size * 2 if i == 0 else dot_size
-                ds_y = dot_size * 2 if i == 0 else dot_size
-                x = (xs + i * 2 * dot_spacing + i * speed) % half_w
-                y = (ys + i * 2 * dot_spacing + i * speed) % half_h
-
-                # bottom/top edges (opposite of set 1)
-                if ty != 0:
-                    bx1 = tx + x
-                    by1 = ty
-                    if x + dot_size > half_w:
-                        draw.rectangle([tx, by1, tx + (x + dot_size - half_w), by1 + ds_y], fill=color)
-                        draw.rectangle([bx1, by1, tx + half_w, by1 + ds_y], fill=color)
-                    else:
-                        draw.rectangle([bx1, by1, bx1 + dot_size, by1 + ds_y], fill=color)
-
-                if tx != 0:
-                    bx1 = tx
-                    by1 = ty + y
-                    if y + dot_size > half_h:
-                        draw.rectangle([bx1, ty, bx1 + ds_x, ty + (y + dot_size - half_h)], fill=color)
-                        draw.rectangle([bx1, by1, bx1 + ds_x, ty + half_h], fill=color)
-                    else:
-                        draw.rectangle([bx1, by1, bx1 + ds_x, by1 + dot_size], fill=color)
+            # set 1: top/bottom edges: horizontal dots
+            if ty == 0:
+                strips.append((0, tx, half_w, off1, ty + half_h - ds,
+                               np.full_like(ds, ty + half_h)))
+            # set 1: left/right edges: vertical dots
+            if tx == 0:
+                strips.append((1, ty, half_h, off1, tx + half_w - ds,
+                               np.full_like(ds, tx + half_w)))
+            # set 2: bottom/top edges (opposite of set 1)
+            if ty != 0:
+                strips.append((0, tx, half_w, off2, np.full_like(ds, ty),
+                               ty + ds))
+            if tx != 0:
+                strips.append((1, ty, half_h, off2, np.full_like(ds, tx),
+                               tx + ds))
+
+        self._dot_strips = strips
+        self._dot_size = dot_size
+        self._dot_color = np.array((255, 0, 0, 255), dtype=np.uint8)
+
+    def _draw_sync_dots(self, overlay, frame_number):
+        """Draw scrolling sync dots in 4 quadrants along edges."""
+        shift = frame_number * self.bar_speed
+        dot = self._dot_size
+
+        # batch all dot rectangles (x0, y0, x1, y1, inclusive) for the frame;
+        # a dot crossing the quadrant edge is split into the clipped part
+        # and the part that wraps around to the start of the quadrant
+        rects = []
+        for axis, origin, length, offsets, cross0, cross1 in self._dot_strips:
+            pos = (shift + offsets) % length
+            end = pos + dot
+            wrap = end > length
+            s0 = origin + np.concatenate((pos, np.zeros_like(pos[wrap])))
+            s1 = origin + np.concatenate((np.minimum(end, length),
+                                          end[wrap] - length))
+            t0 = np.concatenate((cross0, cross0[wrap]))
+            t1 = np.concatenate((cross1, cross1[wrap]))
+            if axis == 0:
+                rects.append(np.stack((s0, t0, s1, t1), axis=1))
+            else:
+                rects.append(np.stack((t0, s0, t1, s1), axis=1))
+        rects = np.concatenate(rects)
+
+        # clip to the frame like ImageDraw: negative starts to 0, and
+        # negative ends to -1 so the slices below come out empty
+        rects[:, :2] = np.maximum(rects[:, :2], 0)
+        rects[:, 2:] = np.maximum(rects[:, 2:], -1)
+
+        color = self._dot_color
+        for x0, y0, x1, y1 in rects.tolist():
+            overlay[y0:y1 + 1, x0:x1 + 1] = color
 
     # -- alignment grid --
 
-    def _draw_alignment_grid(self, draw):
-        """Draw white checkered corner markers along all 4 edges."""
+    def _draw_alignment_grid(self, overlay):
+        """Draw white checkered corner markers along all 4 edges.
+
+        The squares along each edge are first laid out in a 1-D mask, then
+        each edge band is painted with a single masked write.
+        """
         w, h = self.width, self.height
         color = (255, 255, 255, 255)
         sq = 10  # square size
 
-        # horizontal edges (top and bottom corners)
+        # horizontal edges (top and bottom corners): squares at both ends
+        cols = np.zeros(w, dtype=bool)
         for i in range(0, w // 7, 20):
-            # bottom-left
-            draw.rectangle([i, h - sq, i + sq, h], fill=color)
-            # top-left
-            draw.rectangle([i, 0, i + sq, sq], fill=color)
-            # bottom-right
-            draw.rectangle([w - sq - i, h - sq, w - i, h], fill=color)
-            # top-right
-            draw.rectangle([w - sq - i, 0, w - i, sq], fill=color)
-
-        # vertical edges (left and right corners)
+            cols[i:i + sq + 1] = True                        # left
+            cols[max(w - sq - i, 0):w - i + 1] = True        # right
+
+        # vertical edges (left and right corners): squares at both ends
+        rows = np.zeros(h, dtype=bool)
         for i in range(0, h // 7, 20):
-            # bottom-left
-            draw.rectangle([0, h - sq - i, sq, h - i], fill=color)
-            # bottom-right
-            draw.rectangle([w - sq, h - sq - i, w, h - i], fill=color)
-            # top-left
-            draw.rectangle([0, i, sq, i + sq], fill=color)
-            # top-right
-            draw.rectangle([w - sq, i, w, i + sq], fill=color)
+            rows[i:i + sq + 1] = True                        # top
+            rows[max(h - sq - i, 0):h - i + 1] = True        # bottom
+
+        overlay[:sq + 1, cols] = color                       # top
+        overlay[max(h - sq, 0):, cols] = color               # bottom
+        overlay[rows, :sq + 1] = color                       # left
+        overlay[rows, max(w - sq, 0):] = color               # right
 
     # -- ticker --
 
     def _draw_ticker(self, img, frame_number):
         """Draw scrolling ticker image at top of frame."""
-        if self.ticker_image_obj is None:
+        if self._ticker_strip is None:
             return
 
-        ticker_h = 64
-        tex_w, tex_h = self.ticker_image_obj.size
-
-        # build the visible strip by tiling the ticker image
-        strip = Image.new("RGBA", (self.width, ticker_h), (0, 0, 0, 0))
-
-        # scale ticker height to match ticker_h while preserving aspect
-        scale = ticker_h / tex_h
-        scaled_w = int(tex_w * scale)
-        ticker_scaled = self.ticker_image_obj.resize(
-            (scaled_w, ticker_h), Image.LANCZOS
-        )
+        ticker_h = self._ticker_strip.height
         # scroll offset in screen pixels (consistent speed regardless of
         # source image dimensions)
-        scaled_offset = (frame_number * self.ticker_speed) % scaled_w
-
-        # tile across the strip width
-        x = 0
-        src_x = scaled_offset
-        while x < self.width:
-            chunk_w = min(scaled_w - src_x, self.width - x)
-            crop = ticker_scaled.crop((src_x, 0, src_x + chunk_w, ticker_h))
-            strip.paste(crop, (x, 0))
-            x += chunk_w
-            src_x = 0  # after first chunk, start from beginning
-
-        # paste at top of frame
+        offset = (frame_number * self.ticker_speed) % self._ticker_scaled_w
+        strip = self._ticker_strip.crop(
+            (offset, 0, offset + self.width, ticker_h)
+        )
+
+        # paste at top of frame (the strip is opaque, so no blending needed)
         y_pos = self.height - ticker_h - 64  # near top, with some margin
-        img.alpha_composite(strip, (0, y_pos))
+        img.paste(strip, (0, y_pos))
 
     # -- snow --
 
-    def _draw_snow(self, img, frame_number):
+    def _draw_snow(self, overlay, frame_number):
         """Draw random noise block pattern centered on screen."""
         if self._snow_buffer is None:
             return
@@ -514,14 +633,73 @@ class OverlayRenderer:
         # pick a random start row that leaves room for sh rows
         start = random.randint(0, total - sh - 1) if total > sh else 0
 
-        # build raw RGB data from buffer rows
-        raw = b"".join(self._snow_buffer[start:start + sh])
-        snow_img = Image.frombytes("RGB", (sw, sh), raw).convert("RGBA")
-
-        # center on screen
+        # center on screen; the buffer is opaque, so blending would be a
+        # plain copy of the rows into the overlay
         ox = (self.width - sw) // 2
         oy = (self.height - sh) // 2
-        img.alpha_composite(snow_img, (ox, oy))
+        overlay[oy:oy + sh, ox:ox + sw] = self._snow_buffer[start:start + sh]
+
+
+# ---------------------------------------------------------------------------
+# Compositing
+# ---------------------------------------------------------------------------
+
+if numba is not None:
+    @numba.njit(nogil=True, cache=True)
+    def _composite_kernel(bg, overlay, out):
+        """Blend overlay onto bg into out in a single pass over the frame."""
+        h, w = out.shape[0], out.shape[1]
+        for y in range(h):
+            for x in range(w):
+                a = np.int32(overlay[y, x, 3])
+                for c in range(3):
+                    out[y, x, c] = (overlay[y, x, c] * a
+                                    + bg[y, x, c] * (255 - a) + 127) // 255
+
+
+def composite_over(bg, overlay):
+    """Alpha-composite an RGBA overlay onto an opaque RGB background.
+
+    Both arguments are (height, width, N) uint8 arrays. Returns a new
+    (height, width, 3) uint8 RGB array. Uses a fused Numba kernel when
+    numba is installed, otherwise Pillow's masked paste, which blends with
+    the same rounding as Image.alpha_composite over an opaque background.
+    """
+    h, w = overlay.shape[:2]
+    if numba is not None:
+        out = np.empty((h, w, 3), dtype=np.uint8)
+        _composite_kernel(bg, overlay, out)
+        return out
+
+    out = Image.frombytes("RGB", (w, h), np.ascontiguousarray(bg))
+    src = Image.frombuffer("RGBA", (w, h), overlay, "raw", "RGBA", 0, 1)
+    out.paste(src, (0, 0), src)
+    return np.frombuffer(out.tobytes(), np.uint8).reshape(h, w, 3)
+
+
+if cupy is not None:
+    _gpu_composite_kernel = cupy.ElementwiseKernel(
+        "raw uint8 bg, raw uint8 overlay", "uint8 out",
+        """
+        int p = i / 3;
+        int a = overlay[p * 4 + 3];
+        out = (overlay[p * 4 + i % 3] * a + bg[i] * (255 - a) + 127) / 255;
+        """,
+        "sync_test_composite_over",
+    )
+
+
+def composite_over_gpu(bg, overlay):
+    """GPU (CuPy) version of composite_over().
+
+    Uploads the background and overlay, blends them with one elementwise
+    kernel and returns the RGB result as a host array.
+    """
+    bg_dev = cupy.asarray(np.ascontiguousarray(bg))
+    overlay_dev = cupy.asarray(overlay)
+    out = cupy.empty(overlay.shape[:2] + (3,), dtype=cupy.uint8)
+    _gpu_composite_kernel(bg_dev, overlay_dev, out)
+    return cupy.asnumpy(out)
 
 
 # ---------------------------------------------------------------------------
@@ -534,10 +712,57 @@ CODEC_MAP = {
     "av1": "libaom-av1",
 }
 
+# hardware encoders tried in order with --hw-encoder
+HW_CODEC_MAP = {
+    "h264": ["h264_nvenc", "h264_qsv", "h264_vaapi"],
+    "h265": ["hevc_nvenc", "hevc_qsv", "hevc_vaapi"],
+    "av1": ["av1_nvenc", "av1_qsv", "av1_vaapi"],
+}
+
+# per hardware API: (args before inputs, constant quality args followed
+# by the --crf value, output pixel format args). NVENC only honours -cq in
+# VBR mode with the default bitrate target lifted.
+HW_ENCODER_ARGS = {
+    "nvenc": ([], ["-rc", "vbr", "-b:v", "0", "-cq"],
+              ["-pix_fmt", "yuv420p"]),
+    "qsv": ([], ["-global_quality"], ["-pix_fmt", "nv12"]),
+    "vaapi": (["-vaapi_device", "/dev/dri/renderD128"], ["-qp"],
+              ["-vf", "format=nv12,hwupload"]),
+}
+
+# decoded background frames buffered ahead of the render loop (override
+# with SYNC_TEST_GEN_BG_READAHEAD)
+BG_READ_AHEAD = 4
+
+# worker threads rendering and compositing frames ahead of the encoder
+RENDER_THREADS = min(8, os.cpu_count() or 1)
+
+# container formats for live (URL) outputs, keyed by protocol
+LIVE_FORMATS = {
+    "rtp": "rtp",
+    "rtmp": "flv",
+    "srt": "mpegts",
+    "tcp": "mpegts",
+    "udp": "mpegts",
+}
+
 
 class StreamGenerator:
     """Pipeline controller for generation and streaming."""
 
+    def __init__(self):
+        # decoded background frames read ahead by a reader thread
+        self._bg_queue = None
+        self._bg_stop = threading.Event()
+        self._bg_done = False
+        # solid blue background, built once
+        self._blue_bg = None
+        # live output: wall-clock pacing and frame-skip state
+        self._live_start = None
+        self._live_frames = 0
+        self._live_behind = False
+        self._last_frame = None
+
     def _probe_frame_count(self, video_path, framerate, start_time=None):
         """Use ffprobe to get the total number of frames in a video file."""
         # try nb_frames from container metadata (instant)
@@ -594,6 +819,39 @@ class StreamGenerator:
             else:
                 args.frames = 1000
 
+        # GPU compositing pairs with a hardware (NVENC) encoder
+        composite = composite_over
+        if args.gpu:
+            if cupy is None:
+                print("Error: --gpu requires CuPy (pip install cupy-cuda12x)")
+                sys.exit(1)
+            try:
+                devices = cupy.cuda.runtime.getDeviceCount()
+            except Exception:
+                devices = 0
+            if devices < 1:
+                print("Error: --gpu requires a CUDA device, none found")
+                sys.exit(1)
+            composite = composite_over_gpu
+            args.hw_encoder = True
+
+        # the RTP muxer takes a single stream, leaving no room for the
+        # click audio track
+        live = self._is_live_output(args.output)
+        if (live and args.sync_click
+                and args.output.split("://", 1)[0].lower() == "rtp"):
+            print("Error: --sync-click needs an audio stream, which rtp:// "
+                  "output cannot carry; use udp:// or srt:// instead")
+            sys.exit(1)
+
+        # validate decoder read-ahead
+        read_ahead = os.environ.get("SYNC_TEST_GEN_BG_READAHEAD",
+                                    str(BG_READ_AHEAD))
+        if not read_ahead.isdigit() or int(read_ahead) < 1:
+            print("Error: SYNC_TEST_GEN_BG_READAHEAD must be a positive "
+                  f"integer, got '{read_ahead}'")
+            sys.exit(1)
+
         # validate sensor PCB options
         display_size = getattr(args, 'display_size', None)
         sensor_pcb = getattr(args, 'sensor_pcb', None)
@@ -636,38 +894,62 @@ class StreamGenerator:
 
         # start encoder
         encoder = self._start_encoder(args, audio_file=audio_file)
+        if live:
+            print(f"Live output: sending at {args.framerate} fps, frames are "
+                  "repeated while generation is behind")
 
         # start decoder if input video provided
+        frame_size = width * height * 3
         decoder = None
+        bg_reader = None
         if args.input:
             decoder = self._start_decoder(args)
-
-        frame_size = width * height * 3
+            # read decoded frames on a separate thread so waiting on the
+            # decoder never stalls the encoder writes on the main thread
+            self._bg_queue = queue.Queue(maxsize=int(read_ahead))
+            bg_reader = threading.Thread(
+                target=self._read_bg, args=(decoder, frame_size), daemon=True,
+            )
+            bg_reader.start()
         total = args.frames
         report_interval = max(1, total // 10)
 
         print(f"Generating {total} frames at {args.framerate} fps, "
               f"{width}x{height}, codec={args.codec} ...")
 
+        # Frames are rendered and composited on a thread pool (Pillow and
+        # NumPy release the GIL in their C paths) while the main thread
+        # reads backgrounds and writes finished frames to the encoder in
+        # frame order, so rendering overlaps with encoding.
+        pending = collections.deque()
         try:
-            for frame_num in range(1, total + 1):
-                # load background
-                bg = self._load_background(
-                    frame_num, args, decoder, frame_size
-                )
-
-                # render overlay
-                overlay = renderer.render_frame(frame_num)
-
-                # composite
-                composite = Image.alpha_composite(bg.convert("RGBA"), overlay)
+            with ThreadPoolExecutor(max_workers=RENDER_THREADS) as pool:
+                for frame_num in range(1, total + 1):
+                    # load background
+                    bg = self._load_background(
+                        frame_num, args, decoder, frame_size
+                    )
+
+                    if self._live_behind:
+                        # live output behind schedule: skip rendering and
+                        # repeat the previous frame instead
+                        self._live_behind = False
+                        pending.append((frame_num, None))
+                    else:
+                        # render overlay and composite in a worker
+                        future = pool.submit(
+                            self._render_composite, renderer, composite, bg,
+                            frame_num,
+                        )
+                        pending.append((frame_num, future))
 
-                # write raw RGB to encoder
-                encoder.stdin.write(composite.convert("RGB").tobytes())
+                    if len(pending) >= 2 * RENDER_THREADS:
+                        self._write_next(encoder, pending, total,
+                                         report_interval, args, live)
 
-                if frame_num % report_interval == 0 or frame_num == total:
-                    pct = int(100 * frame_num / total)
-                    print(f"  frame {frame_num}/{total} ({pct}%)")
+                while pending:
+                    self._write_next(encoder, pending, total, report_interval,
+                                     args, live)
 
         except BrokenPipeError:
             print("Error: FFmpeg encoder process terminated unexpectedly.")
@@ -675,6 +957,8 @@ class StreamGenerator:
             encoder.stdin.close()
             encoder.wait()
             if decoder:
+                self._bg_stop.set()
+                bg_reader.join()
                 decoder.stdout.close()
                 decoder.wait()
             if audio_file:
@@ -709,6 +993,65 @@ class StreamGenerator:
 
     # -- helpers --
 
+    @staticmethod
+    def _render_composite(renderer, composite, bg, frame_num):
+        """Render the overlay for one frame and composite it onto bg."""
+        return composite(bg, renderer.render_frame(frame_num))
+
+    def _write_next(self, encoder, pending, total, report_interval, args,
+                    live):
+        """Write the oldest pending frame to the encoder and report progress."""
+        frame_num, future = pending.popleft()
+
+        # a skipped frame (no future) repeats the previous composite
+        frame = future.result() if future else self._last_frame
+        self._last_frame = frame
+
+        # write raw RGB to encoder straight from the array's buffer
+        # (the composite functions always return C-contiguous arrays)
+        if live:
+            # only a late rendered frame triggers a repeat, so the picture
+            # keeps advancing even if every write is late
+            late = self._write_live(encoder, frame, args.framerate)
+            self._live_behind = late and future is not None
+        else:
+            encoder.stdin.write(frame.data)
+
+        if frame_num % report_interval == 0 or frame_num == total:
+            pct = int(100 * frame_num / total)
+            print(f"  frame {frame_num}/{total} ({pct}%)")
+
+    @staticmethod
+    def _is_live_output(output):
+        """Return True if output is a streaming URL rather than a file."""
+        return "://" in output
+
+    def _write_live(self, encoder, frame, framerate):
+        """Write a frame to a live encoder, paced to framerate.
+
+        Each frame has a wall-clock deadline counted from the first write.
+        Frames ready early are held until their deadline. Returns True if
+        the write finished more than one frame interval past its deadline,
+        i.e. rendering or encoding is not keeping up; the schedule is then
+        shifted later by the lag rather than bursting frames to catch up.
+        """
+        import time
+
+        now = time.monotonic()
+        if self._live_start is None:
+            self._live_start = now
+        deadline = self._live_start + self._live_frames / framerate
+        self._live_frames += 1
+        if now < deadline:
+            time.sleep(deadline - now)
+        encoder.stdin.write(frame.data)
+        encoder.stdin.flush()
+        late = time.monotonic() - deadline
+        if late <= 1 / framerate:
+            return False
+        self._live_start += late
+        return True
+
     def _generate_click_audio(self, total_frames, framerate, click_interval):
         """Generate a WAV file with 1kHz sine clicks every click_interval frames."""
         import tempfile
@@ -742,14 +1085,61 @@ class StreamGenerator:
             wf.writeframes(bytes(audio))
         return tmp.name
 
+    def _probe_hw_encoder(self, codec, nvenc_only=False):
+        """Return the first hardware encoder for codec that FFmpeg can use.
+
+        With nvenc_only, only the NVENC encoder is considered, so --gpu
+        encodes on the same device it composites on.
+        """
+        try:
+            result = subprocess.run(
+                ["ffmpeg", "-hide_banner", "-encoders"],
+                capture_output=True, text=True, timeout=10,
+            )
+        except subprocess.TimeoutExpired:
+            return None
+
+        for encoder in HW_CODEC_MAP.get(codec, []):
+            if nvenc_only and not encoder.endswith("_nvenc"):
+                continue
+            if f" {encoder} " not in result.stdout:
+                continue
+            # encoders can be compiled in without a usable device, so make
+            # sure one can actually encode a frame
+            pre_args, _, fmt_args = HW_ENCODER_ARGS[encoder.rsplit("_", 1)[1]]
+            cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error"] + pre_args
+            cmd += [
+                "-f", "lavfi", "-i", "color=black:s=256x256:d=0.1",
+                "-frames:v", "1", "-c:v", encoder,
+            ] + fmt_args + ["-f", "null", "-"]
+            try:
+                if subprocess.run(cmd, capture_output=True,
+                                  timeout=20).returncode == 0:
+                    return encoder
+            except subprocess.TimeoutExpired:
+                pass
+        return None
+
     def _start_encoder(self, args, audio_file=None):
         codec = CODEC_MAP.get(args.codec)
         if not codec:
             print(f"Error: unsupported codec '{args.codec}'")
             sys.exit(1)
 
-        cmd = [
-            "ffmpeg", "-y", "-hide_banner", "-loglevel", "warning",
+        hw_args = None
+        if args.hw_encoder:
+            hw_codec = self._probe_hw_encoder(args.codec, nvenc_only=args.gpu)
+            if hw_codec:
+                print(f"Using hardware encoder {hw_codec}")
+                codec = hw_codec
+                hw_args = HW_ENCODER_ARGS[hw_codec.rsplit("_", 1)[1]]
+            else:
+                print(f"No usable hardware encoder found, using {codec}")
+
+        cmd = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "warning"]
+        if hw_args:
+            cmd += hw_args[0]
+        cmd += [
             "-f", "rawvideo", "-pix_fmt", "rgb24",
             "-s", f"{args.width}x{args.height}",
             "-r", str(args.framerate),
@@ -760,14 +1150,27 @@ class StreamGenerator:
         else:
             cmd += ["-an"]
         cmd += ["-c:v", codec]
+        if not hw_args:
+            # let software encoders use all cores
+            cmd += ["-threads", "0", "-thread_type", "frame+slice"]
+            if args.codec == "av1":
+                cmd += ["-row-mt", "1", "-cpu-used", "6"]
         if args.bitrate:
             cmd += ["-b:v", args.bitrate]
+        elif hw_args:
+            cmd += hw_args[1] + [str(args.crf)]
         else:
             crf_flag = "-crf" if args.codec != "av1" else "-crf"
             cmd += [crf_flag, str(args.crf)]
-        cmd += ["-pix_fmt", "yuv420p"]
+        if hw_args:
+            cmd += hw_args[2]
+        else:
+            cmd += ["-pix_fmt", "yuv420p"]
         if audio_file:
             cmd += ["-c:a", "aac", "-b:a", "128k"]
+        if self._is_live_output(args.output):
+            protocol = args.output.split("://", 1)[0].lower()
+            cmd += ["-f", LIVE_FORMATS.get(protocol, "mpegts")]
         cmd.append(args.output)
         return subprocess.Popen(cmd, stdin=subprocess.PIPE)
 
@@ -777,6 +1180,8 @@ class StreamGenerator:
         ]
         if args.start_time:
             cmd += ["-ss", args.start_time]
+        # rgb24 is composited as-is by composite_over(); asking FFmpeg for
+        # rgba would only add a constant alpha byte per pixel to the pipe
         cmd += [
             "-i", args.input,
             "-vframes", str(args.frames),
@@ -786,19 +1191,38 @@ class StreamGenerator:
         ]
         return subprocess.Popen(cmd, stdout=subprocess.PIPE)
 
+    def _read_bg(self, decoder, frame_size):
+        """Reader thread: queue decoded frames until EOF or stop is set.
+
+        A None entry marks the end of the decoder output.
+        """
+        while not self._bg_stop.is_set():
+            raw = decoder.stdout.read(frame_size)
+            frame = raw if len(raw) == frame_size else None
+            while not self._bg_stop.is_set():
+                try:
+                    self._bg_queue.put(frame, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+            if frame is None:
+                return
+
     def _load_background(self, frame_num, args, decoder, frame_size):
-        """Load background image for a given frame number."""
+        """Load background for a given frame number as an RGB array."""
         w, h = args.width, args.height
 
-        if decoder:
-            raw = decoder.stdout.read(frame_size)
-            if len(raw) == frame_size:
-                return Image.frombytes("RGB", (w, h), raw)
+        if decoder and not self._bg_done:
+            raw = self._bg_queue.get()
+            if raw is not None:
+                return np.frombuffer(raw, np.uint8).reshape(h, w, 3)
             # ran out of video frames — fall back to blue
-            return Image.new("RGB", (w, h), (0, 0, 255))
+            self._bg_done = True
 
         # no input: blue background (matches original pgen)
-        return Image.new("RGB", (w, h), (0, 0, 255))
+        if self._blue_bg is None:
+            self._blue_bg = np.full((h, w, 3), (0, 0, 255), dtype=np.uint8)
+        return self._blue_bg
 
 
 # ---------------------------------------------------------------------------
@@ -874,6 +1298,14 @@ def main():
         "--crf", type=int, default=18,
         help="Constant quality factor (default: 18, lower=better, 0=lossless). Ignored if --bitrate is set.",
     )
+    gen.add_argument(
+        "--hw-encoder", action="store_true",
+        help="Use a hardware encoder (NVENC, QSV or VAAPI) if one is available, otherwise fall back to --codec's software encoder",
+    )
+    gen.add_argument(
+        "--gpu", action="store_true",
+        help="Composite frames on an NVIDIA GPU with CuPy and encode with NVENC (implies --hw-encoder; experimental, not tested on GPU hardware)",
+    )
     gen.add_argument(
         "--input", metavar="FILE",
         help="Video file to use as background (if omitted, solid blue background)",
@@ -884,7 +1316,7 @@ def main():
     )
     gen.add_argument(
         "--output", required=True, metavar="FILE",
-        help="Output video file path",
+        help="Output video file path, or a streaming URL (e.g. udp://IP:PORT) for live output",
     )
     # overlay toggle options
     overlay = gen.add_argument_group("overlay options")